@@ -2,9 +2,13 @@
 import logging
 import os
 import sys
+import threading
 
 from github3 import login
 
+# number of requests sent to github at the same time by the thread pools, shared by all the reports
+MAX_CONCURRENT_FETCHES = 8
+
 _logger = logging.getLogger(__name__)
 
 
@@ -12,14 +16,18 @@ class GithubConnection:
     """A connection to GitHub."""
 
     gh = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_connection(cls, token=None):
         """Get the connection."""
-        if not cls.gh:
-            token = token or os.environ.get("GITHUB_TOKEN")
-            if not token:
-                _logger.error("Github token must be provided or set as environment variable (GITHUB_TOKEN).")
-                sys.exit(1)
-            cls.gh = login(token=token)
+        # double-checked so concurrent callers share one login, without locking once it is made
+        if cls.gh is None:
+            with cls._lock:
+                if cls.gh is None:
+                    token = token or os.environ.get("GITHUB_TOKEN")
+                    if not token:
+                        _logger.error("Github token must be provided or set as environment variable (GITHUB_TOKEN).")
+                        sys.exit(1)
+                    cls.gh = login(token=token)
         return cls.gh
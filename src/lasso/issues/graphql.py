@@ -0,0 +1,25 @@
+"""GitHub GraphQL stuff."""
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+class GraphQLError(Exception):
+    """Errors reported by the GitHub GraphQL API."""
+
+    pass
+
+
+def gql(gh, query, variables=None):
+    """Run a GraphQL ``query`` against GitHub and return the ``data`` of the response.
+
+    @param gh: any github3 object (connection, repository, issue…), its authenticated session is used
+    @param query: the GraphQL query or mutation
+    @param variables: optional dict of the variables used in the query
+
+    @return: the ``data`` member of the response
+    """
+    response = gh.session.post(GRAPHQL_URL, json={"query": query, "variables": variables or {}})
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("errors"):
+        raise GraphQLError(payload["errors"])
+    return payload["data"]
@@ -2,20 +2,24 @@
 
 Now if only someone could define "Rdd"! 😆
 """
+import csv
 import logging
 import os
 import re
 import sys
 import types
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 
-import pandas as pd
 import requests
 import rstcloth
 from github3.issues.issue import Issue
 from github3.issues.issue import ShortIssue
 from lasso.issues.github import GithubConnection
+from lasso.issues.github import MAX_CONCURRENT_FETCHES
+from requests.auth import HTTPBasicAuth
 from zenhub import Zenhub
 from zenhub.exceptions import NotFoundError
 
@@ -165,6 +169,7 @@ class RddReport:
         "     - `Dev Release <{}/releases>`_ \n\n"
     )
     SWG_REPO_NAME = "pds-swg"
+    LINE_WIDTH = 160
 
     def __init__(
         self, org, title=None, start_time=None, end_time=None, build=None, token=None, filename="pdsen_issues.rst"
@@ -182,11 +187,13 @@ class RddReport:
         self._gh = GithubConnection.get_connection(token=token)
         self._start_time = start_time
         self._end_time = end_time
+        self._start_datetime = datetime.fromisoformat(start_time) if start_time else None
+        self._end_datetime = datetime.fromisoformat(end_time) if end_time else None
         self._build = build
         self._target_build = build.replace("-SNAPSHOT", "")
 
         self._stream = open(filename, "w")
-        self._rst_doc = RstClothReferenceable(self._stream)
+        self._rst_doc = RstClothReferenceable(self._stream, line_width=self.LINE_WIDTH)
 
         self._rst_doc.title(title)
 
@@ -199,34 +206,41 @@ class RddReport:
     def add_repo(self, repo):
         """Add a repository."""
         issues_map = self._get_issues_groupby_type(repo, state="closed")
-        issue_count = sum([len(issues) for _, issues in issues_map.items()])
+        issue_count = sum(len(issues) for issues in issues_map.values())
         if issue_count > 0:
-            self._write_repo_change_section(repo)
+            self._write_repo_change_section(repo, issue_map=issues_map)
 
     def _get_issues_groupby_type(self, repo, state="closed"):
         """Get the issues grouped by type."""
-        issues = {}
-        for t in RstRddReport.ISSUE_TYPES:
-            issues[t] = []
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            type_issues = executor.map(
+                lambda t: self._get_issues_of_type(repo, t, state=state), RstRddReport.ISSUE_TYPES
+            )
+            return dict(zip(RstRddReport.ISSUE_TYPES, type_issues))
 
-            labels = [t]
-            if self._build:
-                labels.append(self._build)
+    def _get_issues_of_type(self, repo, issue_type, state="closed"):
+        """Get the issues of type ``issue_type``."""
+        issues = []
 
-            self._logger.info("get %s issues for build %s", t, self._build)
-            type_issues = repo.issues(state=state, labels=",".join(labels), direction="asc")
+        labels = [issue_type]
+        if self._build:
+            labels.append(self._build)
 
-            for issue in type_issues:
-                compare_date = issue.created_at
-                if state == "closed":
-                    compare_date = issue.closed_at
+        self._logger.info("get %s issues for build %s", issue_type, self._build)
+        # an issue created or closed after the start time was updated after it too, let github skip the older ones
+        type_issues = repo.issues(state=state, labels=",".join(labels), direction="asc", since=self._start_time)
 
-                if (
-                    not ignore_issue(issue.labels(), ignore_labels=RstRddReport.IGNORED_LABELS)
-                    and (self._end_time is None or compare_date < datetime.fromisoformat(self._end_time))
-                    and (self._start_time is None or compare_date > datetime.fromisoformat(self._start_time))
-                ):
-                    issues[t].append(issue)
+        for issue in type_issues:
+            compare_date = issue.created_at
+            if state == "closed":
+                compare_date = issue.closed_at
+
+            if (
+                not ignore_issue(issue.original_labels, ignore_labels=RstRddReport.IGNORED_LABELS)
+                and (self._end_datetime is None or compare_date < self._end_datetime)
+                and (self._start_datetime is None or compare_date > self._start_datetime)
+            ):
+                issues.append(issue)
 
         return issues
 
@@ -239,16 +253,11 @@ class MetricsRddReport(RddReport):
         title = f"Release Metrics for build {build}" if build else ""
 
         super().__init__(org, title=title, start_time=start_time, end_time=end_time, build=build, token=token)
-        self.issues_type_counts = {}
-        for t in self.ISSUE_TYPES:
-            self.issues_type_counts[t] = 0
+        self.issues_type_counts = dict.fromkeys(self.ISSUE_TYPES, 0)
+        self.issues_type_five_biggest = {t: [] for t in self.ISSUE_TYPES}
 
-        self.issues_type_five_biggest = {}
-        for t in self.ISSUE_TYPES:
-            self.issues_type_five_biggest[t] = []
-
-        self.bugs_open_closed = {}
-        self.bugs_severity = {}
+        self.bugs_open_closed = Counter()
+        self.bugs_severity = Counter()
 
         self.open_bugs = {}
 
@@ -264,15 +273,15 @@ class MetricsRddReport(RddReport):
         print(self.issues_type_counts)
 
         print("Bug States")
-        print(self.bugs_open_closed)
+        print(dict(self.bugs_open_closed))
 
         print("Bug Severity")
-        print(self.bugs_severity)
+        print(dict(self.bugs_severity))
 
         print("Open High/Critical Bugs")
         for s, bugs in self.open_bugs.items():
             print(s)
-            print(bugs)
+            print("\n".join(bugs) + "\n")
 
         print("Closed Epics")
         print(self.epic_closed_for_the_build)
@@ -282,8 +291,8 @@ class MetricsRddReport(RddReport):
         for issue in repo.issues(
             state="closed", labels=f"{self._target_build},{type}", direction="asc", since=self._start_time
         ):
-            if not ignore_issue(issue.labels(), ignore_labels=RstRddReport.IGNORED_LABELS) and (
-                not self._end_time or issue.created_at < datetime.fromisoformat(self._end_time)
+            if not ignore_issue(issue.original_labels, ignore_labels=RstRddReport.IGNORED_LABELS) and (
+                self._end_datetime is None or issue.created_at < self._end_datetime
             ):
                 self.issues_type_counts[type] += 1
 
@@ -292,31 +301,23 @@ class MetricsRddReport(RddReport):
         for issue in repo.issues(
             state="all", labels=f"{self._target_build},bug", direction="asc", since=self._start_time
         ):
-            if not ignore_issue(issue.labels(), ignore_labels=RstRddReport.IGNORED_LABELS) and (
-                not self._end_time or issue.created_at < datetime.fromisoformat(self._end_time)
+            if not ignore_issue(issue.original_labels, ignore_labels=RstRddReport.IGNORED_LABELS) and (
+                self._end_datetime is None or issue.created_at < self._end_datetime
             ):
                 # get severity
                 severity = "s.unknown"
-                for label in issue.labels():
+                for label in issue.original_labels:
                     if label.name.startswith("s."):
                         severity = label.name
                         break
-                if severity in self.bugs_severity.keys():
-                    self.bugs_severity[severity] += 1
-                else:
-                    self.bugs_severity[severity] = 1
+                self.bugs_severity[severity] += 1
 
                 # get state
-                if issue.state in self.bugs_open_closed.keys():
-                    self.bugs_open_closed[issue.state] += 1
-                else:
-                    self.bugs_open_closed[issue.state] = 1
+                self.bugs_open_closed[issue.state] += 1
 
                 if issue.state == "open" and severity in {"s.critical", "s.high", "s.medium", "s.low"}:
                     self._logger.info("%s#%i %s %s %s", repo, issue.number, issue.title, severity, issue.state)
-                    if severity not in self.open_bugs:
-                        self.open_bugs[severity] = ""
-                    self.open_bugs[severity] += "%s#%i %s\n" % (repo, issue.number, issue.title)
+                    self.open_bugs.setdefault(severity, []).append("%s#%i %s" % (repo, issue.number, issue.title))
 
                 # get count
                 if issue.state == "closed":
@@ -375,13 +376,17 @@ class EpicFactory:
             try:
                 epic_child_issues = self._zenhub.get_epic_data(repo.id, gh_issue.number)
                 self._logger.debug(epic_child_issues)
-                for issue in epic_child_issues["issues"]:
-                    if issue["repo_id"] == repo.id:
-                        self._logger.debug("github api request, get issue %i", issue["issue_number"])
-                        gh_child_issue = repo.issue(issue["issue_number"])
-                        if has_label(gh_child_issue, build) and gh_child_issue.state == "closed":
-                            enhancement_child = self.create_enhancement(repo, gh_child_issue, build)
-                            enhancement.add_child(enhancement_child)
+                child_numbers = [
+                    issue["issue_number"] for issue in epic_child_issues["issues"] if issue["repo_id"] == repo.id
+                ]
+                self._logger.debug("github api requests, get issues %s", child_numbers)
+                with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+                    gh_child_issues = list(executor.map(repo.issue, child_numbers))
+                for gh_child_issue in gh_child_issues:
+                    # cheap state test first
+                    if gh_child_issue.state == "closed" and has_label(gh_child_issue, build):
+                        enhancement_child = self.create_enhancement(repo, gh_child_issue, build)
+                        enhancement.add_child(enhancement_child)
             except NotFoundError:
                 self._logger.warning(
                     "The theme %i is not a zenhub Epic, we cannot identify child tickets", gh_issue.number
@@ -401,6 +406,10 @@ class EnhancementTypes(Enum):
     TASK = "task"
 
 
+# label name to enhancement type
+_ENHANCEMENT_TYPES_BY_LABEL = {item.value: item for item in EnhancementTypes}
+
+
 class Enhancement(Issue):
     """An ehancement, a kind of issue."""
 
@@ -425,13 +434,11 @@ class Enhancement(Issue):
     @staticmethod
     def _get_enhancement_type(issue):
         """Get enhancement type."""
-        enhancement_type = EnhancementTypes.TASK
-        for label in issue.labels():
-            if label.name in {item.value for item in EnhancementTypes}:
-                enhancement_type = EnhancementTypes(label.name)
-                break
+        for label in issue.original_labels:
+            if label.name in _ENHANCEMENT_TYPES_BY_LABEL:
+                return _ENHANCEMENT_TYPES_BY_LABEL[label.name]
 
-        return enhancement_type
+        return EnhancementTypes.TASK
 
     def add_child(self, issue):
         """Add a child."""
@@ -442,6 +449,7 @@ class RstRddReport(RddReport):
     """The reStructuredText format Rdd report."""
 
     ZENHUB_TOKEN = "ZENHUB_TOKEN"
+    LINE_WIDTH = 120
 
     def __init__(
         self, org, title=None, start_time=None, end_time=None, build=None, token=None, filename="pdsen_issues.rst"
@@ -450,11 +458,9 @@ class RstRddReport(RddReport):
         if not title:
             build_text = f"(Build {build})" if build else ""
             title = "Release Description Document " + build_text
-        super().__init__(org, title=title, start_time=start_time, end_time=end_time, build=build, token=token)
-
-        self._stream = open(filename, "w")
-        self._rst_doc = RstClothReferenceable(self._stream, line_width=120)
-        self._rst_doc.title(title)
+        super().__init__(
+            org, title=title, start_time=start_time, end_time=end_time, build=build, token=token, filename=filename
+        )
 
         if RstRddReport.ZENHUB_TOKEN not in os.environ.keys():
             self._logger.error("missing %s environment variable", RstRddReport.ZENHUB_TOKEN)
@@ -511,9 +517,13 @@ class RstRddReport(RddReport):
             theme_trees.append(theme)
         return theme_trees
 
-    def _write_repo_change_section(self, repo):
-        """Wrirte repo change section."""
-        issue_map = self._get_issues_groupby_type(repo, state="closed")
+    def _write_repo_change_section(self, repo, issue_map=None):
+        """Wrirte repo change section.
+
+        ``issue_map`` holds the closed issues of ``repo`` grouped by type when the caller already fetched them.
+        """
+        if issue_map is None:
+            issue_map = self._get_issues_groupby_type(repo, state="closed")
 
         issue_count = sum([len(issues) for issues in issue_map.values()])
 
@@ -527,10 +537,11 @@ class RstRddReport(RddReport):
 
     def _add_other_updates(self, repo, issues_map, ignore_tickets=None):
         """Add other updates."""
+        issue_count = 0
         for type, issues in issues_map.items():
-            issues_map[type] = list(set(issues) - ignore_tickets)
-
-        issue_count = sum([len(issues) for issues in issues_map.values()])
+            # keep the order of the issues, as returned by github, in the report
+            issues_map[type] = [issue for issue in issues if issue not in ignore_tickets]
+            issue_count += len(issues_map[type])
 
         if issue_count > 0:
             self._rst_doc.h3("Other Updates")
@@ -558,7 +569,7 @@ class RstRddReport(RddReport):
     @staticmethod
     def _testing_status(issue):
         """Testing status."""
-        for label in issue.labels():
+        for label in issue.original_labels:
             if label.name == RstRddReport.SKIP_TESTING:
                 return StatusEmoji.SKIP.value
             elif label.name == RstRddReport.TESTING_COMPLETE:
@@ -586,7 +597,7 @@ class RstRddReport(RddReport):
             data = []
             for enhancement in theme_crawler:
                 issue = enhancement.issue
-                if not ignore_issue(issue.labels(), ignore_labels=RstRddReport.IGNORED_LABELS):
+                if not ignore_issue(issue.original_labels, ignore_labels=RstRddReport.IGNORED_LABELS):
                     self._logger.debug("crawl theme tree %i", issue.number)
                     self._rst_doc.hyperlink(f"{repo.name}#{issue.number}", issue.html_url)
 
@@ -852,10 +863,8 @@ class RstRddReport(RddReport):
     def add_repo(self, repo):
         """Add ``repo``."""
         issues_map = self._get_issues_groupby_type(repo, state="closed")
-        issue_count = sum([len(issues) for _, issues in issues_map.items()])
-
-        if issue_count > 0:
-            self._write_repo_change_section(repo)
+        # the section is only written when there are issues, see _write_repo_change_section
+        self._write_repo_change_section(repo, issue_map=issues_map)
 
     def write(self, filename):
         """Write to the file named ``filename``."""
@@ -873,6 +882,8 @@ class CsvTestCaseReport(RddReport):
     """Report as test cases importable in test management software. Used with testrail."""
 
     TEST_CASE_REFS_REGEX = ["B[0-9][0-9]\.[0.9]", "s\..*", "p\..*", "requirement", "bug", "i&t.automated"]  # noqa
+    # a label is kept when any of the regexes above matches its beginning
+    _TEST_CASE_REFS_PATTERN = re.compile("|".join(f"(?:{regex})" for regex in TEST_CASE_REFS_REGEX))
     # TODO make that an argument
     PROJECT_ID = 168
     # TODO make that an argument
@@ -896,9 +907,11 @@ class CsvTestCaseReport(RddReport):
         )
         self._filename = filename
 
-        from requests.auth import HTTPBasicAuth
-
-        self._basic_auth = HTTPBasicAuth(testrail_user_email, testrail_user_token)
+        # a single session keeps the connection to testrail alive across the many API calls
+        self._testrail_session = requests.Session()
+        self._testrail_session.auth = HTTPBasicAuth(testrail_user_email, testrail_user_token)
+        self._testrail_session.headers.update({"content-type": "application/json"})
+        self._testrail_session.verify = False
         self._testrail_url = testrail_base_url
         self._update_section_ids()
         self._current_repo_existing_cases = {}
@@ -906,11 +919,8 @@ class CsvTestCaseReport(RddReport):
         self._build_issue_refs = []
 
     def _update_section_ids(self):
-        section_response = requests.get(
-            f"{self._testrail_url}/index.php?/api/v2/get_sections/{self.PROJECT_ID}&suite_id={self.SUITE_ID}",
-            auth=self._basic_auth,
-            headers={"content-type": "application/json"},
-            verify=False,
+        section_response = self._testrail_session.get(
+            f"{self._testrail_url}/index.php?/api/v2/get_sections/{self.PROJECT_ID}&suite_id={self.SUITE_ID}"
         )
         # depending on testrail version
         section_response_json = section_response.json()
@@ -932,8 +942,13 @@ class CsvTestCaseReport(RddReport):
         )
         print("\n".join(self._build_issue_refs))
 
-        df = pd.DataFrame.from_dict(self._issues)
-        df.to_csv(self._filename)
+        # columns are the union of the issue keys, rows are prefixed with their index
+        fieldnames = list(dict.fromkeys(key for issue in self._issues for key in issue))
+        with open(self._filename, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file, lineterminator="\n")
+            writer.writerow(["", *fieldnames])
+            for index, issue in enumerate(self._issues):
+                writer.writerow([index, *(issue.get(key) for key in fieldnames)])
 
     def _extract_acceptance_criteria(self, body: str):
         issue_body_sections = body.split("\n## ")
@@ -960,10 +975,7 @@ class CsvTestCaseReport(RddReport):
         return issue_dict
 
     def _keep_as_test_case_label(self, label: str):
-        for regex in self.TEST_CASE_REFS_REGEX:
-            if re.match(regex, label):
-                return True
-        return False
+        return self._TEST_CASE_REFS_PATTERN.match(label) is not None
 
     def _post_test_case(self, issue_ref, acn, test_case: dict, repo_name):
         case_ref = f"{issue_ref}-AC{acn}"
@@ -975,9 +987,7 @@ class CsvTestCaseReport(RddReport):
             # create
             url = f"{self._testrail_url}/index.php?/api/v2/add_case/{self._sections[repo_name]}"
 
-        resp = requests.post(
-            url, json=test_case, auth=self._basic_auth, headers={"content-type": "application/json"}, verify=False
-        )
+        resp = self._testrail_session.post(url, json=test_case)
         _logger.debug("new test case created or updated %s with status %s", test_case["title"], resp.status_code)
 
     def _to_testrail_test_case(self, issue, repo_name):
@@ -987,8 +997,7 @@ class CsvTestCaseReport(RddReport):
         test_case["type_id"] = 1
         test_case["priority_id"] = 1
         test_case_labels = [label.name for label in issue.original_labels if self._keep_as_test_case_label(label.name)]
-        url_split = issue.url.split("/")
-        issue_ref = f"{url_split[-3]}#{url_split[-1]}"
+        issue_ref = f"{repo_name}#{issue.number}"
         # keep the list to be printing
         self._build_issue_refs.append(issue_ref)
         test_case_labels.append(issue_ref)
@@ -1031,21 +1040,14 @@ class CsvTestCaseReport(RddReport):
         if repo.name not in self._sections.keys():
             # new repository, new section
             new_section = dict(suite_id=self.SUITE_ID, name=repo.name, description=repo.description)
-            _ = requests.post(
-                f"{self._testrail_url}/index.php?/api/v2/add_section/{self.PROJECT_ID}",
-                json=new_section,
-                auth=self._basic_auth,
-                headers={"content-type": "application/json"},
-                verify=False,
+            _ = self._testrail_session.post(
+                f"{self._testrail_url}/index.php?/api/v2/add_section/{self.PROJECT_ID}", json=new_section
             )
             self._update_section_ids()
         else:
             # get existing test cases
-            cases_resp = requests.get(
-                f"{self._testrail_url}/index.php?/api/v2/get_cases/{self.PROJECT_ID}&suite_id={self.SUITE_ID}&section_id={self._sections[repo.name]}",
-                auth=self._basic_auth,
-                headers={"content-type": "application/json"},
-                verify=False,
+            cases_resp = self._testrail_session.get(
+                f"{self._testrail_url}/index.php?/api/v2/get_cases/{self.PROJECT_ID}&suite_id={self.SUITE_ID}&section_id={self._sections[repo.name]}"
             )
             cases_json = cases_resp.json()
             # if true for testrail version 8
@@ -1057,17 +1059,15 @@ class CsvTestCaseReport(RddReport):
                 ac_ref = [ref for ref in refs if ref.startswith("AC")][0]
                 self._current_repo_existing_cases[f"{issue_ref}-{ac_ref}"] = case["id"]
 
-        for short_issue in repo.issues(state="closed", labels=self._build, direction="asc"):
+        ignored_labels = RstRddReport.IGNORED_LABELS | {"i&t.skipped"}
+        for short_issue in repo.issues(state="closed", labels=self._build, direction="asc", since=self._start_time):
             compare_date = short_issue.closed_at
-            ignored_labels = RstRddReport.IGNORED_LABELS
-            ignored_labels.add("i&t.skipped")
             if (
-                not ignore_issue(short_issue.labels(), ignore_labels=RstRddReport.IGNORED_LABELS)
-                and (self._end_time is None or compare_date < datetime.fromisoformat(self._end_time))
-                and (self._start_time is None or compare_date > datetime.fromisoformat(self._start_time))
+                not ignore_issue(short_issue.original_labels, ignore_labels=ignored_labels)
+                and (self._end_datetime is None or compare_date < self._end_datetime)
+                and (self._start_datetime is None or compare_date > self._start_datetime)
             ):
-                full_issue = repo.issue(short_issue.number)
-                self._to_testrail_test_case(full_issue, repo.name)
+                self._to_testrail_test_case(short_issue, repo.name)
                 # issue_dict = self._to_csv_issue(issue)
                 # self._issues.append(issue_dict)
 
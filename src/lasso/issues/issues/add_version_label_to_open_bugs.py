@@ -1,18 +1,58 @@
 """Lasso Issues: add version label to open bugs issues."""
 import argparse
+import json
 import logging
 
 from github3.exceptions import NotFoundError
 from lasso.issues.argparse import add_standard_arguments
 from lasso.issues.github import GithubConnection
+from lasso.issues.graphql import gql
 from lasso.issues.issues.issues import DEFAULT_GITHUB_ORG
 
 
 COLOR_OF_VERSION_LABELS = "#062C9B"
 
+# number of aliased mutations sent in a single GraphQL request
+LABEL_MUTATION_BATCH_SIZE = 50
+
+OPEN_BUGS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(states: OPEN, labels: ["bug"], first: 100, after: $cursor) {
+      nodes { id }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+LABEL_ID_QUERY = """
+query($owner: String!, $name: String!, $label: String!) {
+  repository(owner: $owner, name: $name) {
+    label(name: $label) { id }
+  }
+}
+"""
+
 _logger = logging.getLogger(__name__)
 
 
+def get_open_bug_ids(repo):
+    """Get the GraphQL node ids of the open bugs of a repository.
+
+    @param repo: repository from the github3 api
+    @return: list of the node ids
+    """
+    variables = {"owner": repo.owner.login, "name": repo.name, "cursor": None}
+    bug_ids = []
+    while True:
+        issues = gql(repo, OPEN_BUGS_QUERY, variables)["repository"]["issues"]
+        bug_ids.extend(node["id"] for node in issues["nodes"])
+        if not issues["pageInfo"]["hasNextPage"]:
+            return bug_ids
+        variables["cursor"] = issues["pageInfo"]["endCursor"]
+
+
 def add_label_to_open_bugs(repo, label_name: str, dry_run: bool = True):
     """Add a label (str) to the open bugs of a repository.
 
@@ -23,14 +63,26 @@ def add_label_to_open_bugs(repo, label_name: str, dry_run: bool = True):
     @param dry_run: does not update the issue with new label
 
     @return: True if at least on bug has been found and labelled
+    @raise ValueError: if the label does not exist in the repository
     """
-    one_found = False
-    for issue in repo.issues(state="open", labels=["bug"]):
-        one_found = True
-        if not dry_run:
-            issue.add_labels(label_name)
-
-    return one_found
+    bug_ids = get_open_bug_ids(repo)
+    if bug_ids and not dry_run:
+        label = gql(repo, LABEL_ID_QUERY, {"owner": repo.owner.login, "name": repo.name, "label": label_name})
+        if label["repository"]["label"] is None:
+            raise ValueError(f"label {label_name} does not exist in {repo.owner.login}/{repo.name}, create it first")
+        label_id = json.dumps(label["repository"]["label"]["id"])
+        # one request labels a whole batch of issues, one aliased mutation per issue
+        for start in range(0, len(bug_ids), LABEL_MUTATION_BATCH_SIZE):
+            batch = bug_ids[start : start + LABEL_MUTATION_BATCH_SIZE]
+            mutations = "\n".join(
+                f"m{i}: addLabelsToLabelable(input: {{labelableId: {json.dumps(bug_id)}, labelIds: [{label_id}]}}) "
+                "{ clientMutationId }"
+                for i, bug_id in enumerate(batch)
+            )
+            gql(repo, f"mutation {{\n{mutations}\n}}")
+            _logger.info("label %s added to %i open bugs", label_name, len(batch))
+
+    return bool(bug_ids)
 
 
 def create_label_if_not_exists(repo, label: str, color: str):
@@ -73,7 +125,10 @@ def main():
     gh = GithubConnection.get_connection(token=args.token)
     repo = gh.repository(args.github_org, args.github_repo)
     label = f"open.{args.labelled_version}"
-    create_label_if_not_exists(repo, label, COLOR_OF_VERSION_LABELS)
+    if args.dry_run:
+        _logger.info("dry run, label %s is not created.", label)
+    else:
+        create_label_if_not_exists(repo, label, COLOR_OF_VERSION_LABELS)
     print("Add the following line to your release notes on github:")
     section_title = "**Known bugs** and possible work arounds"
     if add_label_to_open_bugs(repo, label, dry_run=args.dry_run):
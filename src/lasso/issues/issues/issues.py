@@ -1,25 +1,42 @@
 """Lasso Issues: issue handling."""
 import argparse
 import logging
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from github3.exceptions import NotFoundError
 from lasso.issues.argparse import add_standard_arguments
 from lasso.issues.github import GithubConnection
+from lasso.issues.github import MAX_CONCURRENT_FETCHES
 from lasso.issues.issues import CsvTestCaseReport
 from lasso.issues.issues import MetricsRddReport
 from lasso.issues.issues import RstRddReport
 from lasso.issues.issues.utils import get_issue_priority
-from lasso.issues.issues.utils import get_issues_groupby_type
+from lasso.issues.issues.utils import get_issues_of_type
+from lasso.issues.issues.utils import ISSUE_TYPES
 from lasso.issues.issues.utils import TOP_PRIORITIES
 from mdutils.mdutils import MdUtils
 
 
 DEFAULT_GITHUB_ORG = "NASA-PDS"
 
+# up to this number of repositories requested by name, they are looked up one by one instead of listing the org
+MAX_DIRECT_REPOS = 3
+
 _logger = logging.getLogger(__name__)
 
 
+def write_md_table(md_file, rows):
+    """Write the ``rows`` in ``md_file`` as a left-aligned table, the first row being the header.
+
+    Produces the same markdown as ``MdUtils.new_table`` but with a single join instead of adding up the cells
+    one at a time.
+    """
+    lines = ["|" + "|".join(row) + "|" for row in rows]
+    lines.insert(1, "|" + " :--- |" * len(rows[0]))
+    md_file.write("\n" + "\n".join(lines) + "\n")
+
+
 def convert_issues_to_known_bugs_report(md_file, repo_name, issues_map):
     """Convert the issue map into a known bug report, e.g. for a release."""
     md_file.new_header(level=1, title=repo_name)
@@ -28,59 +45,86 @@ def convert_issues_to_known_bugs_report(md_file, repo_name, issues_map):
         "Here is the list of the known bug for the current release, "
         "click on them for more information and possible work around."
     )
-    table = ["Issue", "Severity"]
-    count = 1
+    rows = [("Issue", "Severity")]
     for short_issue in issues_map["bug"]:
         issue = f"[{repo_name}#{short_issue.number}]({short_issue.html_url}) - {short_issue.title}"
         priority = get_issue_priority(short_issue)
 
-        table.extend([issue, priority])
-        count += 1
+        rows.append((issue, priority))
 
     md_file.new_line()
-    md_file.new_table(columns=2, rows=int(len(table) / 2), text=table, text_align="left")
+    write_md_table(md_file, rows)
 
 
 def convert_issues_to_planning_report(md_file, repo_name, issues_map):
     """Conver the issues into a planning report."""
     md_file.new_header(level=1, title=repo_name)
 
-    for issue_type in issues_map:
+    # issue number to its table row; an issue labelled with several types is listed under each of them
+    issue_rows = {}
+    for issue_type, issues in issues_map.items():
         md_file.new_header(level=2, title=issue_type)
 
-        table = ["Issue", "Priority / Bug Severity", "On Deck"]
-        count = 1
-        for short_issue in issues_map[issue_type]:
-            issue = f"[{repo_name}#{short_issue.number}]({short_issue.html_url}) - {short_issue.title}"
-            priority = get_issue_priority(short_issue)
+        rows = [("Issue", "Priority / Bug Severity", "On Deck")]
+        for short_issue in issues:
+            if short_issue.number not in issue_rows:
+                issue = f"[{repo_name}#{short_issue.number}]({short_issue.html_url}) - {short_issue.title}"
+                priority = get_issue_priority(short_issue)
+                ondeck = "X" if priority in TOP_PRIORITIES else ""
+                issue_rows[short_issue.number] = (issue, priority, ondeck)
 
-            ondeck = ""
-            if priority in TOP_PRIORITIES:
-                ondeck = "X"
-
-            table.extend([issue, priority, ondeck])
-            count += 1
+            rows.append(issue_rows[short_issue.number])
 
         md_file.new_line()
-        md_file.new_table(columns=3, rows=int(len(table) / 3), text=table, text_align="left")
+        write_md_table(md_file, rows)
+
+
+# the markdown report converters, by name of report
+REPORT_FUNCTIONS = {
+    "planning": convert_issues_to_planning_report,
+    "known_bugs": convert_issues_to_known_bugs_report,
+}
+
+
+def _get_repos(gh, org, repos):
+    """Get the repositories of ``org`` named in ``repos``, all of them if ``repos`` is empty."""
+    if not repos or len(repos) > MAX_DIRECT_REPOS:
+        return [_repo for _repo in gh.repositories_by(org) if not repos or _repo.name in repos]
+
+    # sorted and deduplicated, like the org listing which orders the repositories by name
+    _repos = []
+    for name in sorted(set(repos)):
+        try:
+            _repos.append(gh.repository(org, name))
+        except NotFoundError:
+            _logger.warning("repository %s/%s not found, skipped", org, name)
+    return _repos
 
 
 def create_md_issue_report(org, repos, issue_state="all", start_time=None, token=None, output_report="planning"):
     """Create the issue report, in Markdown format."""
     gh = GithubConnection.get_connection(token=token)
 
-    out_report_function_name = f"convert_issues_to_{output_report}_report"
-    thismodule = sys.modules[__name__]
-    out_report_function = getattr(thismodule, out_report_function_name)
+    out_report_function = REPORT_FUNCTIONS[output_report]
 
     current_date = datetime.now().strftime("%Y-%m-%d")
     title = "PDS EN Issues" if output_report == "planning" else f"Known Bugs on {current_date}"
     _md_file = MdUtils(file_name="pdsen_issues", title=title)
-    for _repo in gh.repositories_by(org):
-        if repos and _repo.name not in repos:
-            continue
-        issues_map = get_issues_groupby_type(_repo, state=issue_state, start_time=start_time)
-        out_report_function(_md_file, _repo.name, issues_map)
+    _repos = _get_repos(gh, org, repos)
+
+    # the known bugs report only reads the bugs, do not request the other types
+    issue_types = ["bug"] if output_report == "known_bugs" else ISSUE_TYPES
+
+    # each type of each repository is fetched concurrently, so a repository with many issues of one type
+    # does not hold back the others, but the report is written in the order of the repositories
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+        type_issues = executor.map(
+            lambda task: get_issues_of_type(*task, state=issue_state, start_time=start_time),
+            [(_repo, t) for _repo in _repos for t in issue_types],
+        )
+        for _repo in _repos:
+            issues_map = {t: next(type_issues) for t in issue_types}
+            out_report_function(_md_file, _repo.name, issues_map)
 
     _md_file.create_md_file()
 
@@ -111,7 +155,12 @@ def main():
 
     parser.add_argument("--build", default=None, help="build label, for example B11.1 or B12.0")
 
-    parser.add_argument("--report", default="planning", help="planning or known_bugs, only applies when --format=md")
+    parser.add_argument(
+        "--report",
+        default="planning",
+        choices=list(REPORT_FUNCTIONS),
+        help="planning or known_bugs, only applies when --format=md",
+    )
 
     parser.add_argument("--testrail-url", help="URL of testrail")
     parser.add_argument("--testrail-user-email", help="email used to authenticate the user of testrail API")
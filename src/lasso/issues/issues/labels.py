@@ -18,6 +18,9 @@ from lasso.issues.argparse import add_standard_arguments
 
 DEFAULT_GITHUB_ORG = "NASA-PDS"
 
+# libyaml's C loader when PyYAML was built with it, the pure-Python one otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _logger = logging.getLogger(__name__)
 
 
@@ -27,40 +30,54 @@ class Labels:
     def __init__(self, org, repos, token, dev=False):
         """Initializer."""
         self._org = org
-        self._repos = []
         self._gh = login(token=token)
 
+        # archived repositories cannot be updated
         if repos:
-            for repo in repos:
-                self._repos.append(self._gh.repository(self._org, repo))
+            _repos = [self._gh.repository(self._org, repo) for repo in repos]
         else:
-            self._repos = self._gh.repositories_by(self._org)
-
-    def create_labels_for_org(self, label_name, label_color):
-        """Create labels for an organization."""
-        _logger.info(f'Creating label "{label_name}" (color: "{label_color}")')
-        for repo in self._repos:
-            if not repo.archived:
-                self.create_label(repo, label_name, label_color)
+            _repos = self._gh.repositories_by(self._org)
+        self._repos = [repo for repo in _repos if not repo.archived]
+
+    def create_labels_for_org(self, labels):
+        """Create labels for an organization, ``labels`` maps the label names to their colors."""
+        # github label names are case-insensitive
+        existing_labels = {repo.name: {label.name.lower(): label for label in repo.labels()} for repo in self._repos}
+        for label_name, label_color in labels.items():
+            _logger.info(f'Creating label "{label_name}" (color: "{label_color}")')
+            for repo in self._repos:
+                self.create_label(repo, label_name, label_color, existing_labels=existing_labels[repo.name])
 
     def delete_labels_for_org(self, labels):
         """Delete labels from an organization."""
         for repo in self._repos:
-            if not repo.archived:
-                for label in repo.labels():
-                    if label.name in labels.keys():
-                        label.delete()
-                        _logger.info("%s: Delete SUCCESS" % repo)
-
-    def create_label(self, repo, label_name, label_color):
-        """Create a label in ``repo`` named ``label_name`` and colored ``label_color``."""
+            for label in repo.labels():
+                if label.name in labels.keys():
+                    label.delete()
+                    _logger.info("%s: Delete SUCCESS" % repo)
+
+    def create_label(self, repo, label_name, label_color, existing_labels=None):
+        """Create a label in ``repo`` named ``label_name`` and colored ``label_color``.
+
+        ``existing_labels`` optionally maps the lower-cased names of the labels already in ``repo`` to the labels,
+        to spare looking up the label.
+        """
         try:
-            try:
-                label = repo.label(label_name)
+            if existing_labels is None:
+                try:
+                    label = repo.label(label_name)
+                except NotFoundError:
+                    label = None
+            else:
+                label = existing_labels.get(label_name.lower())
+
+            if label:
                 label.update(label_name, label_color)
                 _logger.info("%s: Update SUCCESS" % repo)
-            except NotFoundError:
-                repo.create_label(label_name, label_color)
+            else:
+                label = repo.create_label(label_name, label_color)
+                if existing_labels is not None:
+                    existing_labels[label_name.lower()] = label
                 _logger.info("%s: Creation SUCCESS" % repo)
         except ForbiddenError:
             # Most likely due to archived repo, just keep going
@@ -68,6 +85,7 @@ class Labels:
         except (UnprocessableEntity, ConnectionError):
             _logger.warning("Odd connection error or out of API calls. Wait 1 hour...")
             time.sleep(3600)
+            # look the label up again, it may have been created since existing_labels was listed
             self.create_label(repo, label_name, label_color)
         except Exception:
             _logger.error("ERROR: Create/update failed.")
@@ -107,14 +125,13 @@ def main():
 
     if args.label_name and args.label_color:
         if args.create:
-            labels_obj.create_labels_for_org(args.label_name, args.label_color)
+            labels_obj.create_labels_for_org({args.label_name: args.label_color})
         elif args.delete:
             labels_obj.delete_labels_for_org({args.label_name: ""})
     elif args.config_file:
         with open(args.config_file) as _file:
-            _yml = yaml.load(_file, Loader=yaml.FullLoader)
+            _yml = yaml.load(_file, Loader=_YAML_LOADER)
             if args.delete:
                 labels_obj.delete_labels_for_org(_yml["labels"])
             elif args.create:
-                for name, color in _yml["labels"].items():
-                    labels_obj.create_labels_for_org(name, color)
+                labels_obj.create_labels_for_org(_yml["labels"])
@@ -45,7 +45,7 @@ def move_issue(issue, target_repository, label=None, dry_run=False):
 
     You can optionally assign a new ``label`` to it. And if ``dry_run`` is True, we just hand-wave it.
     """
-    labels = [label.name for label in issue.labels()]
+    labels = [label.name for label in issue.original_labels]
     if label:
         labels.append(label)
 
@@ -78,15 +78,11 @@ def move_issues(source_repo, target_repo, gh_connection, label=None, dry_run=Tru
     owner, repo_name = target_repo.split("/")
     target_repository = gh_connection.repository(owner, repo_name)
 
-    pull_request_numbers = []
-    for pull_request in source_repository.pull_requests(state="all"):
-        pull_request_numbers.append(pull_request.number)
-
     for short_issue in source_repository.issues(state="all"):
-        if short_issue.number not in pull_request_numbers:
+        # the issues listing includes the pull requests, which carry pull request urls
+        if not short_issue.pull_request_urls:
             logger.info("move issue %d", short_issue.number)
-            issue = source_repository.issue(short_issue.number)
-            move_issue(issue, target_repository, label=label, dry_run=dry_run)
+            move_issue(short_issue, target_repository, label=label, dry_run=dry_run)
 
 
 def main():
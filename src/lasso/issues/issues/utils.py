@@ -1,68 +1,87 @@
 """Utilities."""
+import logging
+
 ISSUE_TYPES = ["bug", "enhancement", "requirement", "theme"]
 TOP_PRIORITIES = ["p.must-have", "s.high", "s.critical"]
 IGNORE_LABELS = ["wontfix", "duplicate", "invalid"]
 
+_logger = logging.getLogger(__name__)
+
+# for constant time label lookups
+_ISSUE_TYPES_SET = frozenset(ISSUE_TYPES)
+_IGNORE_LABELS_SET = frozenset(IGNORE_LABELS)
+
+# priority (p.) and bug severity (s.) labels
+_PRIORITY_PREFIXES = ("p.", "s.")
+
 
 def get_issue_type(issue):
     """Get issue type."""
-    for label in issue.labels():
-        if label.name in ISSUE_TYPES:
+    for label in issue.original_labels:
+        if label.name in _ISSUE_TYPES_SET:
             return label.name
 
 
 def get_issue_priority(short_issue):
     """Get issue priority."""
-    for label in short_issue.labels():
-        if "p." in label.name or "s." in label.name:
+    for label in short_issue.original_labels:
+        if label.name.startswith(_PRIORITY_PREFIXES):
             return label.name
 
     return "unknown"
 
 
-def ignore_issue(labels, ignore_labels=IGNORE_LABELS):
+def ignore_issue(labels, ignore_labels=_IGNORE_LABELS_SET):
     """Ignore issue."""
-    for label in labels:
-        if label.name in ignore_labels:
-            return True
+    if not isinstance(ignore_labels, (set, frozenset)):
+        ignore_labels = frozenset(ignore_labels)
+    return not ignore_labels.isdisjoint(label.name for label in labels)
 
-    return False
 
+def iter_issues_groupby_type(repo, state="all", start_time=None, ignore_types=None):
+    """Iterate over the issues of ``repo`` as (type, issue) pairs, type after type.
 
-def get_issues_groupby_type(repo, state="all", start_time=None, ignore_types=None):
-    """Get issues grouped by type."""
-    issues = {}
+    The issues are yielded as github returns them, without keeping them all in memory.
+    """
     for t in ISSUE_TYPES:
-        print(f"++++++++{t}")
-        if ignore_types and t in ignore_types:
-            continue
+        if not ignore_types or t not in ignore_types:
+            for issue in iter_issues_of_type(repo, t, state=state, start_time=start_time):
+                yield t, issue
 
-        issues[t] = []
-        for issue in repo.issues(state=state, labels=t, direction="asc", since=start_time):
-            if not ignore_issue(issue.labels()):
-                issues[t].append(issue)
+
+def get_issues_groupby_type(repo, state="all", start_time=None, ignore_types=None):
+    """Get issues grouped by type."""
+    issues = {t: [] for t in ISSUE_TYPES if not ignore_types or t not in ignore_types}
+    for t, issue in iter_issues_groupby_type(repo, state=state, start_time=start_time, ignore_types=ignore_types):
+        issues[t].append(issue)
 
     return issues
 
 
+def iter_issues_of_type(repo, issue_type, state="all", start_time=None):
+    """Iterate over the issues of ``repo`` labelled with ``issue_type``, except the ignored ones."""
+    _logger.info("Processing type %s of %s", issue_type, repo.name)
+    for issue in repo.issues(state=state, labels=issue_type, direction="asc", since=start_time):
+        if not ignore_issue(issue.original_labels):
+            yield issue
+
+
+def get_issues_of_type(repo, issue_type, state="all", start_time=None):
+    """Get the issues of ``repo`` labelled with ``issue_type``, except the ignored ones."""
+    return list(iter_issues_of_type(repo, issue_type, state=state, start_time=start_time))
+
+
 def get_labels(gh_issue):
     """Get Label Names.
 
     Return list of label names for easier access.
     """
-    labels = []
-    for label in gh_issue.labels():
-        labels.append(label.name)
-
-    return labels
+    return [label.name for label in gh_issue.original_labels]
 
 
 def has_label(gh_issue, label_name):
     """Has label."""
-    for _label in gh_issue.labels():
-        if _label.name == label_name:
-            return True
-    return False
+    return any(label.name == label_name for label in gh_issue.original_labels)
 
 
 def is_theme(labels, zen_issue):
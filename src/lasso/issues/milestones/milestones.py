@@ -24,10 +24,12 @@ SPRINT_BACKLOG_LABEL = "sprint-backlog"
 
 def get_next_milestone(repo, milestone):
     """Get the next mielstone."""
-    for m in repo.milestones():
-        if m.number == milestone.number + 1:
-            return m
-    return None
+    try:
+        m = repo.milestone(milestone.number + 1)
+    except exceptions.NotFoundError:
+        return None
+    # a closed milestone cannot receive the deferred issues
+    return m if m.state == "open" else None
 
 
 def get_milestone(repo, sprint_title):
@@ -43,7 +45,7 @@ def move_open_issues(repo, milestone, next_milestone):
     for issue in repo.issues(milestone=milestone.number, state="open"):
         labels = []
         already_late = False
-        for label in issue.labels():
+        for label in issue.original_labels:
             if label.name == DELAYED_LABELS_RUNNING_LATE:
                 labels.append(DELAYED_LABELS_RUNNING_LATER)
                 already_late = True
@@ -62,11 +64,11 @@ def move_open_issues(repo, milestone, next_milestone):
 def remove_closed_issues_from_sprint_backlog(repo, milestone):
     """Remove issues that got closed in ``repo`` for the given ``mitlestone`` from the sprint backlog."""
     for issue in repo.issues(milestone=milestone.number, state="closed"):
-        labels = []
-        for label in issue.labels():
-            if SPRINT_BACKLOG_LABEL != label.name:
-                labels.append(label.name)
-        issue.edit(labels=labels)
+        labels = [label.name for label in issue.original_labels]
+        # only send an update for the issues which actually are in the sprint backlog
+        if SPRINT_BACKLOG_LABEL in labels:
+            labels.remove(SPRINT_BACKLOG_LABEL)
+            issue.edit(labels=labels)
 
 
 def defer_open_issues(repo, milestone):
@@ -132,6 +134,13 @@ def main():
         else:
             _due_date = datetime.datetime.strptime(args.due_date, "%Y-%m-%d") + datetime.timedelta(hours=8)
 
+    gh = login(token=token)
+    _repos = [
+        _repo
+        for _repo in gh.repositories_by(args.github_org)
+        if not args.github_repos or _repo.name in args.github_repos
+    ]
+
     _sprint_number = args.prepend_number
     for n in _sprint_names:
         _sprint_name = n.replace(" ", ".")
@@ -143,12 +152,7 @@ def main():
             _sprint_name = f"{str(_sprint_number).zfill(2)}.{_sprint_name}"
             _sprint_number += 1
 
-        # connect to github
-        gh = login(token=token)
-        for _repo in gh.repositories_by(args.github_org):
-            if args.github_repos and _repo.name not in args.github_repos:
-                continue
-
+        for _repo in _repos:
             if args.create:
                 _logger.info(f"+++ milestone: {_sprint_name}, due: {_due_date}")
                 try:
@@ -0,0 +1,76 @@
+"""Add version label to open bugs tests."""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from lasso.issues.issues.add_version_label_to_open_bugs import add_label_to_open_bugs
+
+
+def _response(data):
+    response = MagicMock()
+    response.json.return_value = {"data": data}
+    return response
+
+
+def _bugs_page(ids, end_cursor=None):
+    return _response(
+        {
+            "repository": {
+                "issues": {
+                    "nodes": [{"id": i} for i in ids],
+                    "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+                }
+            }
+        }
+    )
+
+
+class AddLabelToOpenBugsTestCase(unittest.TestCase):
+    """Test case for ``add_label_to_open_bugs``."""
+
+    def setUp(self):
+        """Set up a fake repository."""
+        self.repo = SimpleNamespace(owner=SimpleNamespace(login="NASA-PDS"), name="lasso-issues", session=MagicMock())
+
+    def test_batched_mutations(self):
+        """Open bugs are paged through and labelled with one request per batch."""
+        bug_ids = [f"I_{i}" for i in range(120)]
+        self.repo.session.post.side_effect = [
+            _bugs_page(bug_ids[:100], end_cursor="c1"),
+            _bugs_page(bug_ids[100:]),
+            _response({"repository": {"label": {"id": "LA_1"}}}),
+            _response({}),
+            _response({}),
+            _response({}),
+        ]
+        self.assertTrue(add_label_to_open_bugs(self.repo, "open.v1.0.0", dry_run=False))
+
+        calls = self.repo.session.post.call_args_list
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(calls[1].kwargs["json"]["variables"]["cursor"], "c1")
+        mutations = [c.kwargs["json"]["query"] for c in calls[3:]]
+        self.assertEqual([m.count("addLabelsToLabelable") for m in mutations], [50, 50, 20])
+        self.assertIn('labelableId: "I_119", labelIds: ["LA_1"]', mutations[-1])
+
+    def test_missing_label(self):
+        """Labelling with a label not created yet fails with the label and repository names."""
+        self.repo.session.post.side_effect = [_bugs_page(["I_1"]), _response({"repository": {"label": None}})]
+        with self.assertRaisesRegex(ValueError, "open.v1.0.0 .* NASA-PDS/lasso-issues"):
+            add_label_to_open_bugs(self.repo, "open.v1.0.0", dry_run=False)
+        self.assertEqual(self.repo.session.post.call_count, 2)
+
+    def test_dry_run(self):
+        """Dry runs only look for the open bugs."""
+        self.repo.session.post.side_effect = [_bugs_page(["I_1"])]
+        self.assertTrue(add_label_to_open_bugs(self.repo, "open.v1.0.0"))
+        self.assertEqual(self.repo.session.post.call_count, 1)
+
+    def test_no_bugs(self):
+        """Nothing is labelled when there are no open bugs."""
+        self.repo.session.post.side_effect = [_bugs_page([])]
+        self.assertFalse(add_label_to_open_bugs(self.repo, "open.v1.0.0", dry_run=False))
+        self.assertEqual(self.repo.session.post.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Markdown issue report tests."""
+import unittest
+from unittest.mock import MagicMock
+
+from github3.exceptions import NotFoundError
+from lasso.issues.issues.issues import _get_repos
+from lasso.issues.issues.issues import MAX_DIRECT_REPOS
+from lasso.issues.issues.issues import write_md_table
+from mdutils.mdutils import MdUtils
+
+
+class WriteMdTableTestCase(unittest.TestCase):
+    """Test case for ``write_md_table``."""
+
+    def test_same_as_mdutils(self):
+        """The table is the one MdUtils would have written."""
+        rows = [
+            ("Issue", "Priority / Bug Severity", "On Deck"),
+            ("[lasso-issues#1](https://github.com/NASA-PDS/lasso-issues/issues/1) - a bug", "s.high", "X"),
+            ("[lasso-issues#2](https://github.com/NASA-PDS/lasso-issues/issues/2) - a feature", "unknown", ""),
+        ]
+        expected = MdUtils(file_name="expected")
+        expected.new_table(columns=3, rows=3, text=[cell for row in rows for cell in row], text_align="left")
+        md_file = MdUtils(file_name="actual")
+        write_md_table(md_file, rows)
+        self.assertEqual(md_file.file_data_text, expected.file_data_text)
+
+    def test_header_only(self):
+        """A table without issues still has its header."""
+        md_file = MdUtils(file_name="actual")
+        write_md_table(md_file, [("Issue", "Severity")])
+        self.assertEqual(md_file.file_data_text, "\n|Issue|Severity|\n| :--- | :--- |\n")
+
+
+class GetReposTestCase(unittest.TestCase):
+    """Test case for ``_get_repos``."""
+
+    def setUp(self):
+        """Set up a fake github connection where the repository ``missing`` does not exist."""
+        self.gh = MagicMock()
+
+        def repository(org, name):
+            if name == "missing":
+                raise NotFoundError(MagicMock(status_code=404))
+            return name
+
+        self.gh.repository.side_effect = repository
+
+    def test_direct_lookup(self):
+        """A few names are looked up sorted and once each, a missing one is skipped with a warning."""
+        with self.assertLogs("lasso.issues.issues.issues", level="WARNING") as logs:
+            repos = _get_repos(self.gh, "NASA-PDS", ["validate", "missing", "validate"])
+        self.assertEqual(repos, ["validate"])
+        looked_up = [c.args for c in self.gh.repository.call_args_list]
+        self.assertEqual(looked_up, [("NASA-PDS", "missing"), ("NASA-PDS", "validate")])
+        self.assertIn("NASA-PDS/missing", logs.output[0])
+        self.gh.repositories_by.assert_not_called()
+
+    def test_org_listing(self):
+        """More names than ``MAX_DIRECT_REPOS`` are filtered out of the org listing."""
+        listed = [MagicMock() for _ in range(MAX_DIRECT_REPOS + 2)]
+        for i, repo in enumerate(listed):
+            repo.name = f"repo{i}"
+        self.gh.repositories_by.return_value = listed
+        names = [repo.name for repo in listed[1:]]
+        self.assertEqual(_get_repos(self.gh, "NASA-PDS", names), listed[1:])
+        self.gh.repository.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Label creation tests."""
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from github3.exceptions import UnprocessableEntity
+from lasso.issues.issues.labels import Labels
+
+
+def _label(name):
+    label = MagicMock()
+    label.name = name
+    return label
+
+
+def _repo(name, *label_names):
+    repo = MagicMock(archived=False)
+    repo.name = name
+    repo.labels.return_value = [_label(label_name) for label_name in label_names]
+    return repo
+
+
+class CreateLabelsTestCase(unittest.TestCase):
+    """Test case for the creation of the labels of an org."""
+
+    def _labels(self, *repos):
+        gh = MagicMock()
+        gh.repositories_by.return_value = list(repos)
+        with patch("lasso.issues.issues.labels.login", return_value=gh):
+            return Labels("NASA-PDS", None, "token")
+
+    def test_update_case_variant(self):
+        """An existing label whose name differs only in case is updated, not created."""
+        repo = _repo("lasso-issues", "Bug")
+        self._labels(repo).create_labels_for_org({"bug": "#ff0000"})
+        repo.labels.return_value[0].update.assert_called_once_with("bug", "#ff0000")
+        repo.create_label.assert_not_called()
+
+    def test_created_label_is_reused(self):
+        """A label created during the run is updated by a later case variant of its name."""
+        repo = _repo("lasso-issues")
+        created = MagicMock()
+        repo.create_label.return_value = created
+        self._labels(repo).create_labels_for_org({"bug": "#ff0000", "Bug": "#00ff00"})
+        repo.create_label.assert_called_once_with("bug", "#ff0000")
+        created.update.assert_called_once_with("Bug", "#00ff00")
+
+    @patch("lasso.issues.issues.labels.time.sleep")
+    def test_retry_looks_label_up_again(self, sleep):
+        """After a 422 the label is looked up in the repository instead of the stale listing."""
+        repo = _repo("lasso-issues")
+        repo.create_label.side_effect = UnprocessableEntity(MagicMock(status_code=422))
+        repo.label.return_value = existing = MagicMock()
+        self._labels(repo).create_labels_for_org({"bug": "#ff0000"})
+        sleep.assert_called_once()
+        repo.create_label.assert_called_once()
+        repo.label.assert_called_once_with("bug")
+        existing.update.assert_called_once_with("bug", "#ff0000")
+
+    def test_archived_repos_are_skipped(self):
+        """Archived repositories are left alone."""
+        repo, archived = _repo("lasso-issues"), _repo("old", "bug")
+        archived.archived = True
+        self._labels(repo, archived).create_labels_for_org({"bug": "#ff0000"})
+        archived.labels.assert_not_called()
+        repo.create_label.assert_called_once_with("bug", "#ff0000")
+
+
+if __name__ == "__main__":
+    unittest.main()
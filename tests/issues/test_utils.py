@@ -0,0 +1,74 @@
+"""Issue utilities tests."""
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from lasso.issues.issues.utils import get_issue_priority
+from lasso.issues.issues.utils import get_issue_type
+from lasso.issues.issues.utils import get_issues_groupby_type
+from lasso.issues.issues.utils import get_labels
+from lasso.issues.issues.utils import has_label
+from lasso.issues.issues.utils import ignore_issue
+from lasso.issues.issues.utils import iter_issues_groupby_type
+
+
+def _issue(*label_names):
+    """An issue as listed by github, its ``labels()`` must not be called."""
+    issue = MagicMock()
+    issue.original_labels = [SimpleNamespace(name=name) for name in label_names]
+    issue.labels.side_effect = AssertionError("labels are already in the listed issue")
+    return issue
+
+
+class LabelHelpersTestCase(unittest.TestCase):
+    """Test case for the label helpers."""
+
+    def test_issue_type(self):
+        """The type is read from the labels."""
+        self.assertEqual(get_issue_type(_issue("B14.0", "requirement")), "requirement")
+        self.assertIsNone(get_issue_type(_issue("B14.0")))
+        self.assertEqual(get_issue_type(_issue("bug", "theme")), "bug")
+
+    def test_issue_priority(self):
+        """Priorities and severities are found, the others are unknown."""
+        self.assertEqual(get_issue_priority(_issue("bug", "s.high")), "s.high")
+        self.assertEqual(get_issue_priority(_issue("requirement", "p.must-have")), "p.must-have")
+        self.assertEqual(get_issue_priority(_issue("bug")), "unknown")
+        self.assertEqual(get_issue_priority(_issue("needs.triage", "p.should-have")), "p.should-have")
+
+    def test_ignore_issue(self):
+        """Issues with an ignored label are ignored."""
+        self.assertTrue(ignore_issue(_issue("bug", "wontfix").original_labels))
+        self.assertFalse(ignore_issue(_issue("bug").original_labels))
+
+    def test_labels(self):
+        """Label names are listed and looked up."""
+        issue = _issue("bug", "s.high")
+        self.assertEqual(get_labels(issue), ["bug", "s.high"])
+        self.assertTrue(has_label(issue, "bug"))
+        self.assertFalse(has_label(issue, "theme"))
+
+
+class IssuesGroupbyTypeTestCase(unittest.TestCase):
+    """Test case for the grouping of the issues by type."""
+
+    def setUp(self):
+        """A repository with a bug, an ignored bug and a theme."""
+        self.bug, self.theme = _issue("bug"), _issue("theme")
+        issues_by_label = {"bug": [self.bug, _issue("bug", "duplicate")], "theme": [self.theme]}
+        self.repo = MagicMock()
+        self.repo.issues.side_effect = lambda labels, **kwargs: iter(issues_by_label.get(labels, []))
+
+    def test_iter(self):
+        """The issues are yielded with their type, the ignored ones are skipped."""
+        pairs = list(iter_issues_groupby_type(self.repo, ignore_types=["enhancement"]))
+        self.assertEqual(pairs, [("bug", self.bug), ("theme", self.theme)])
+
+    def test_groupby(self):
+        """Every type not ignored has its list, even when empty."""
+        issues = get_issues_groupby_type(self.repo, ignore_types=["enhancement"])
+        self.assertEqual(issues, {"bug": [self.bug], "requirement": [], "theme": [self.theme]})
+
+
+if __name__ == "__main__":
+    unittest.main()